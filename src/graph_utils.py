@@ -1,24 +1,434 @@
-from neo4j import GraphDatabase
-import networkx as nx
+import atexit
+import hashlib
+import importlib.util
+import json
+import time
+import warnings
+from pathlib import Path
+
+from neo4j import GraphDatabase, READ_ACCESS
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import ArrowStyle
 from netgraph import Graph as ngGraph
+import requests
+from scipy.optimize import minimize
+from scipy.sparse import csr_matrix, diags
 
+# Computed node layouts are cached here, keyed by the graph's structure
+_LAYOUT_CACHE_DIR = Path.home() / ".cache" / "mem0_graph"
 
-def display_graph(uri: str, username: str, password: str):
+# The graph changes with every memory added, so only the most recently used
+# layouts are kept
+_LAYOUT_CACHE_MAX_FILES = 64
+
+# Graphs larger than this are laid out with the L-BFGS solver instead of
+# NetGraph's iterative spring layout
+_SPARSE_LAYOUT_MIN_NODES = 500
+
+# Graphs larger than this are laid out on the GPU when cuGraph is available
+_GPU_LAYOUT_MIN_NODES = 1000
+
+# Whether the optional RAPIDS packages are installed. They are only imported
+# once a graph is large enough to need them, as importing them sets up CUDA.
+_HAS_CUGRAPH = all(
+    importlib.util.find_spec(name) is not None for name in ("cudf", "cugraph")
+)
+
+# Labels are only drawn when at most this many nodes are in view
+_MAX_LABELLED_NODES = 50
+
+# How close, in pixels, the cursor must be to an edge to show its label
+_HOVER_TOLERANCE_PX = 5
+
+# Minimum time between pan redraws and hover hit-tests, capping them at the
+# display refresh rate
+_FRAME_INTERVAL = 1 / 60
+
+# Keep-alive HTTP session for reading over Neo4j's transactional endpoint
+_HTTP_SESSION = None
+
+# Bolt driver shared across calls, along with the uri, username and a digest
+# of the password it was created for
+_DRIVER = None
+_DRIVER_KEY = None
+
+
+def _get_driver(uri: str, username: str, password: str):
+    """
+    Returns the shared Neo4j driver, creating it on first use.
+
+    Drivers are thread-safe and hold a connection pool, so reusing one
+    across calls skips the connection handshake and pool warm-up. A new
+    driver replaces the shared one if the connection details change.
+
+    Parameters:
+    -----------
+    uri : str
+        The connection URI for the Neo4j database
+    username : str
+        Username for authentication with the Neo4j database
+    password : str
+        Password for authentication with the Neo4j database
+
+    Returns:
+    --------
+    neo4j.Driver
+        A driver connected to the given database
+    """
+    global _DRIVER, _DRIVER_KEY
+    # Keep only a digest of the password so the secret itself isn't held
+    # in a module global
+    key = (uri, username, hashlib.blake2b(password.encode("utf-8")).digest())
+    if _DRIVER is not None and _DRIVER_KEY != key:
+        _close_driver()
+    if _DRIVER is None:
+        _DRIVER = GraphDatabase.driver(
+            uri, auth=(username, password), max_connection_pool_size=15
+        )
+        _DRIVER_KEY = key
+    return _DRIVER
+
+
+@atexit.register
+def _close_driver():
+    """Closes the shared Neo4j driver, if one is open."""
+    global _DRIVER, _DRIVER_KEY
+    if _DRIVER is not None:
+        _DRIVER.close()
+    _DRIVER = None
+    _DRIVER_KEY = None
+
+
+def _layout_cache_path(nodes, edge_index) -> Path:
+    """
+    Returns the cache file for a graph's layout, keyed by a hash of its
+    node set and edge set.
+
+    Parameters:
+    -----------
+    nodes : list
+        Node names in the graph
+    edge_index : np.ndarray
+        Integer array of shape (n_edges, 2) with the positions in ``nodes``
+        of each edge's source and target
+
+    Returns:
+    --------
+    pathlib.Path
+        Location of the compressed ``.npz`` layout snapshot
+    """
+    # Relabel nodes by their sorted rank so the key doesn't depend on the
+    # order rows came back in, then sort the edges on those ranks. Names are
+    # compared by their JSON encoding, which orders names of mixed types and
+    # keeps tuple-valued names whole.
+    encoded = np.array([json.dumps(name, default=repr) for name in nodes], dtype=str)
+    order = np.argsort(encoded, kind='stable')
+    rank = np.empty(len(nodes), dtype=np.int64)
+    rank[order] = np.arange(len(nodes))
+    ranked_edges = rank[edge_index].reshape(-1, 2)
+    ranked_edges = ranked_edges[np.lexsort((ranked_edges[:, 1], ranked_edges[:, 0]))]
+
+    digest = hashlib.blake2b(json.dumps(encoded[order].tolist()).encode("utf-8"))
+    digest.update(np.ascontiguousarray(ranked_edges).tobytes())
+    return _LAYOUT_CACHE_DIR / f"{digest.hexdigest()}.npz"
+
+
+def _load_layout(path: Path, nodes):
+    """
+    Loads a cached layout as a ``{node: np.array([x, y])}`` dictionary.
+
+    Returns None if there is no usable snapshot for the given nodes.
+    """
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as snapshot:
+            names = json.loads(snapshot["names"].item())
+            positions = dict(zip(names, snapshot["positions"]))
+        if set(positions) != set(nodes):
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    try:
+        # Mark the snapshot as recently used so pruning keeps it
+        path.touch()
+    except OSError:
+        pass
+    return positions
+
+
+def _save_layout(path: Path, node_positions):
+    """
+    Writes computed node positions to a compressed ``.npz`` snapshot, then
+    prunes the cache down to the most recently used snapshots.
+
+    Node names are stored as JSON so that they load back with their original
+    type; layouts whose names don't survive the round trip aren't cached.
+    """
+    names = list(node_positions)
+    try:
+        encoded_names = json.dumps(names)
+        if json.loads(encoded_names) != names:
+            return
+    except (TypeError, ValueError):
+        return
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            names=np.array(encoded_names),
+            positions=np.array([node_positions[name] for name in names], dtype=float),
+        )
+        snapshots = sorted(
+            path.parent.glob("*.npz"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        for stale in snapshots[_LAYOUT_CACHE_MAX_FILES:]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        # Caching is best-effort; a read-only home directory shouldn't break plotting
+        pass
+
+
+def _fit_to_frame(nodes, X, origin=(0., 0.), scale=(1., 1.)):
+    """
+    Rescales layout coordinates into the frame NetGraph draws in, leaving a
+    margin for node markers.
+
+    Parameters:
+    -----------
+    nodes : list
+        Node names in the graph
+    X : np.ndarray
+        Array of shape (len(nodes), 2) with one row of coordinates per node
+    origin : tuple
+        Bottom-left corner of the frame
+    scale : tuple
+        Width and height of the frame
+
+    Returns:
+    --------
+    dict
+        Mapping of node name to np.array([x, y])
+    """
+    origin = np.asarray(origin, dtype=float)
+    scale = np.asarray(scale, dtype=float)
+    span = np.ptp(X, axis=0)
+    span[span == 0] = 1.0
+    X = origin + 0.05 * scale + 0.9 * scale * (X - X.min(axis=0)) / span
+    return dict(zip(nodes, X))
+
+
+def _sparse_fruchterman_reingold(nodes, edge_index, origin=(0., 0.), scale=(1., 1.),
+                                 max_iter=100, gravity=0.1, block_size=1024, seed=0):
+    """
+    Computes a force-directed layout by minimising the Fruchterman-Reingold
+    energy with SciPy's L-BFGS optimizer.
+
+    The energy is the sum of squared edge lengths (attraction, via a sparse
+    graph Laplacian) minus the sum of log pairwise distances (repulsion),
+    plus a weak pull towards the centre that keeps disconnected components
+    from drifting apart. Using curvature information, L-BFGS reaches the
+    minimum in far fewer iterations than the classic FR update.
+
+    Parameters:
+    -----------
+    nodes : list
+        Node names in the graph
+    edge_index : np.ndarray
+        Integer array of shape (n_edges, 2) with the positions in ``nodes``
+        of each edge's source and target
+    origin : tuple
+        Bottom-left corner of the frame to fit the layout into
+    scale : tuple
+        Width and height of the frame to fit the layout into
+    max_iter : int
+        Maximum number of L-BFGS iterations
+    gravity : float
+        Strength of the pull towards the centre
+    block_size : int
+        Number of rows of the pairwise repulsion computed at once, bounding
+        peak memory to block_size * len(nodes) floats
+    seed : int
+        Seed for the random initial positions
+
+    Returns:
+    --------
+    dict
+        Mapping of node name to np.array([x, y])
+    """
+    n = len(nodes)
+    rows, cols = edge_index[:, 0], edge_index[:, 1]
+    adjacency = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    adjacency = adjacency + adjacency.T
+    laplacian = diags(np.asarray(adjacency.sum(axis=1)).ravel()) - adjacency
+    diagonal = np.arange(n)
+
+    def energy_and_gradient(flat):
+        X = flat.reshape(n, 2)
+        LX = laplacian @ X
+        energy = np.sum(X * LX) + gravity * np.sum(X * X)
+        gradient = 2 * LX + 2 * gravity * X
+
+        x, y = X[:, 0], X[:, 1]
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            dx = x[start:stop, None] - x
+            dy = y[start:stop, None] - y
+            dist2 = dx * dx + dy * dy
+            # A node doesn't repel itself; log(1) and dx = 0 cancel it out
+            dist2[diagonal[:stop - start], diagonal[start:stop]] = 1.0
+            energy -= 0.25 * np.log(dist2).sum()
+            inv_dist2 = 1.0 / dist2
+            gradient[start:stop, 0] -= np.einsum('ij,ij->i', dx, inv_dist2)
+            gradient[start:stop, 1] -= np.einsum('ij,ij->i', dy, inv_dist2)
+        return energy, gradient.ravel()
+
+    initial = np.random.default_rng(seed).random((n, 2)) * np.sqrt(n)
+    result = minimize(
+        energy_and_gradient, initial.ravel(), jac=True,
+        method='L-BFGS-B', options={'maxiter': max_iter}
+    )
+    return _fit_to_frame(nodes, result.x.reshape(n, 2), origin, scale)
+
+
+def _gpu_force_atlas2(nodes, edge_index, origin=(0., 0.), scale=(1., 1.),
+                      max_iter=500, seed=0):
+    """
+    Computes a Barnes-Hut ForceAtlas2 layout on the GPU with cuGraph.
+
+    Requires the optional RAPIDS packages (cudf, cugraph).
+
+    Parameters:
+    -----------
+    nodes : list
+        Node names in the graph
+    edge_index : np.ndarray
+        Integer array of shape (n_edges, 2) with the positions in ``nodes``
+        of each edge's source and target
+    origin : tuple
+        Bottom-left corner of the frame to fit the layout into
+    scale : tuple
+        Width and height of the frame to fit the layout into
+    max_iter : int
+        Number of ForceAtlas2 iterations
+    seed : int
+        Seed for placing isolated nodes
+
+    Returns:
+    --------
+    dict
+        Mapping of node name to np.array([x, y])
+    """
+    import cudf
+    import cugraph
+
+    edge_df = cudf.DataFrame({'src': edge_index[:, 0], 'dst': edge_index[:, 1]})
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(edge_df, source='src', destination='dst', renumber=True)
+    positions = cugraph.force_atlas2(G, max_iter=max_iter).to_pandas()
+
+    vertices = positions['vertex'].to_numpy()
+    X = np.empty((len(nodes), 2))
+    X[vertices, 0] = positions['x'].to_numpy()
+    X[vertices, 1] = positions['y'].to_numpy()
+
+    # An edge list has no room for isolated nodes; scatter them over the layout
+    isolated = np.ones(len(nodes), dtype=bool)
+    isolated[vertices] = False
+    if isolated.any():
+        rng = np.random.default_rng(seed)
+        lo = X[~isolated].min(axis=0) if (~isolated).any() else np.zeros(2)
+        hi = X[~isolated].max(axis=0) if (~isolated).any() else np.ones(2)
+        X[isolated] = rng.uniform(lo, hi, size=(isolated.sum(), 2))
+
+    return _fit_to_frame(nodes, X, origin, scale)
+
+
+def _stream_rows_http(uri: str, username: str, password: str, query: str,
+                      database: str = "neo4j", parameters: dict | None = None):
+    """
+    Runs a read query through Neo4j's HTTP transactional endpoint in a single
+    request and yields result rows as they arrive.
+
+    The response is requested as a Jolt JSON sequence, so each row is a
+    separate line which can be parsed as soon as it is received instead of
+    waiting for the whole result document.
+
+    Parameters:
+    -----------
+    uri : str
+        Base HTTP URI of the Neo4j server (e.g., "http://localhost:7474")
+    username : str
+        Username for authentication with the Neo4j database
+    password : str
+        Password for authentication with the Neo4j database
+    query : str
+        Cypher query to run
+    database : str
+        Name of the database to query
+    parameters : dict, optional
+        Values for the query's $parameters
+
+    Yields:
+    -------
+    list
+        Column values of each result row, in the order of the RETURN clause
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = requests.Session()
+
+    response = _HTTP_SESSION.post(
+        f"{uri.rstrip('/')}/db/{database}/tx/commit",
+        json={"statements": [{"statement": query, "parameters": parameters or {}}]},
+        auth=(username, password),
+        headers={"Accept": "application/vnd.neo4j.jolt+json-seq"},
+        stream=True,
+    )
+    with response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            # Each JSON sequence record is prefixed with an ASCII record separator
+            line = line.strip(b"\x1e")
+            if not line:
+                continue
+            event = json.loads(line)
+            if "data" in event:
+                yield event["data"]
+            elif "error" in event:
+                messages = "; ".join(e["message"] for e in event["error"]["errors"])
+                raise RuntimeError(f"Neo4j query failed: {messages}")
+
+
+def display_graph(uri: str, username: str, password: str, database: str = "neo4j",
+                  roots: list[str] | None = None):
     """
     Connects to a Neo4j database, retrieves nodes and relationships, 
-    constructs a directed graph using NetworkX, and visualizes it 
+    collects them into a directed edge list, and visualizes it 
     interactively using NetGraph and Matplotlib.
 
     Parameters:
     -----------
     uri : str
-        The connection URI for the Neo4j database (e.g., "bolt://localhost:7687")
+        The connection URI for the Neo4j database (e.g., "bolt://localhost:7687").
+        An "http://" or "https://" URI (e.g., "http://localhost:7474") reads
+        through the HTTP transactional endpoint instead of the Bolt driver.
     username : str
         Username for authentication with the Neo4j database
     password : str
         Password for authentication with the Neo4j database
+    database : str
+        Name of the database to read from. Naming it up front saves the driver
+        a round trip to resolve the user's home database.
+    roots : list of str, optional
+        Names of nodes to center the visualization on. When given, only the
+        relationships within two hops of these nodes are fetched, filtered on
+        the server in a single batched query. By default the whole graph is
+        shown.
 
     Returns:
     --------
@@ -26,16 +436,67 @@ def display_graph(uri: str, username: str, password: str):
         Displays a graph if data exists; returns a message if no data to plot.
     """
 
-    # Step 1: Set up connection to Neo4j database
-    driver = GraphDatabase.driver(uri, auth=(username, password))
-
-    # Step 2: Cypher query to fetch all nodes and optional relationships
+    # Step 1: Cypher query to fetch all relationships and isolated nodes.
+    # UNION deduplicates rows on the server, so every row received is unique:
+    # the first branch yields one row per node without relationships, the
+    # second one row per edge. Connected nodes arrive as edge endpoints.
     query = """
-    MATCH (n)
-    OPTIONAL MATCH (n)-[r]->(m)
+    MATCH (n) WHERE NOT (n)--()
+    RETURN n.name AS source_name, NULL AS relationship_type, NULL AS target_name
+    UNION
+    MATCH (n)-[r]->(m)
     RETURN n.name AS source_name, type(r) AS relationship_type, m.name AS target_name
     """
 
+    # For a subgraph, UNWIND batches all roots into one round trip; roots
+    # without outgoing relationships are still returned as nodes
+    if roots:
+        query = """
+        UNWIND $roots AS root
+        MATCH (n {name: root}) WHERE NOT (n)-->()
+        RETURN n.name AS source_name, NULL AS relationship_type, NULL AS target_name
+        UNION
+        UNWIND $roots AS root
+        MATCH p = (n {name: root})-[*1..2]->()
+        UNWIND relationships(p) AS r
+        RETURN startNode(r).name AS source_name, type(r) AS relationship_type,
+               endNode(r).name AS target_name
+        """
+    parameters = {'roots': roots} if roots else {}
+
+    columns = ['source_name', 'relationship_type', 'target_name']
+
+    def split_graph_data(df):
+        """
+        Splits the query result into isolated nodes and edges with vectorized
+        column operations.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            Query result with 'source_name', 'relationship_type' and
+            'target_name' columns
+
+        Returns:
+        --------
+        tuple: (list of isolated node names, DataFrame of edges with columns
+               'source', 'target' and 'type')
+        """
+        is_node = df['relationship_type'].isna()
+        isolated_nodes = df.loc[is_node, 'source_name'].dropna().tolist()
+        # Edges missing either endpoint can't be drawn, and a null name
+        # would otherwise be factorized to -1 and reach the layout code
+        edges = (
+            df.loc[~is_node]
+            .dropna(subset=['source_name', 'target_name'])
+            .rename(columns={
+                'source_name': 'source',
+                'target_name': 'target',
+                'relationship_type': 'type',
+            })
+        )
+        return isolated_nodes, edges
+
     def get_graph_data(tx):
         """
         Executes the Neo4j query in a read transaction and structures the data.
@@ -47,52 +508,81 @@ def display_graph(uri: str, username: str, password: str):
 
         Returns:
         --------
-        tuple: (list of node names, list of edge tuples with relationship types)
+        tuple: (list of isolated node names, DataFrame of edges)
         """
-        result = tx.run(query)
-        nodes = set()
-        edges = []
-
-        for record in result:
-            source_name = record["source_name"]
-            target_name = record["target_name"]
-            relationship = record["relationship_type"]
-
-            if source_name:
-                nodes.add(source_name)
-            if target_name:
-                nodes.add(target_name)
-                edges.append((source_name, target_name, relationship))
-
-        return list(nodes), edges
-
-    # Step 3: Run the query using a database session
-    with driver.session() as session:
-        nodes, edges = session.execute_read(get_graph_data)
-
-    # Step 4: Build a directed graph using NetworkX
-    G = nx.DiGraph()
-    G.add_nodes_from(nodes)
-    G.add_edges_from([
-        (source, target, {'type': rel_type}) for source, target, rel_type in edges
-    ])
-
-    # Step 5: Set up the Matplotlib figure and axes
+        return split_graph_data(tx.run(query, parameters).to_df())
+
+    # Step 2: Fetch the data over HTTP, or through a session on the shared
+    # Bolt driver
+    if uri.startswith(("http://", "https://")):
+        isolated_nodes, edges = split_graph_data(pd.DataFrame.from_records(
+            _stream_rows_http(uri, username, password, query, database, parameters),
+            columns=columns,
+        ))
+    else:
+        # fetch_size=-1 has the server stream the whole result after a single
+        # PULL, rather than one round trip per batch of 1000 records
+        driver = _get_driver(uri, username, password)
+        with driver.session(
+            database=database, default_access_mode=READ_ACCESS, fetch_size=-1
+        ) as session:
+            isolated_nodes, edges = session.execute_read(get_graph_data)
+
+    # Step 3: Collect the directed edge list and node list for NetGraph,
+    # which takes them as-is, without materializing an intermediate graph.
+    # Only the last relationship between a pair of nodes is drawn; its type
+    # is shown when hovering over the edge.
+    edges = edges.drop_duplicates(subset=['source', 'target'], keep='last')
+    edge_list = list(zip(edges['source'], edges['target']))
+    edge_labels = dict(zip(edge_list, edges['type']))
+
+    # Integer-code every node once; the layout code works on the resulting
+    # contiguous (n_edges, 2) index array rather than on node names
+    codes, uniques = pd.factorize(pd.concat([
+        edges['source'], edges['target'], pd.Series(isolated_nodes, dtype=object)
+    ], ignore_index=True))
+    nodes = uniques.tolist()
+    n_edges = len(edge_list)
+    edge_index = np.column_stack([codes[:n_edges], codes[n_edges:2 * n_edges]])
+
+    # Step 4: Set up the Matplotlib figure and axes
     fig, ax = plt.subplots(figsize=(15, 12))
     plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
 
+    # Step 5: Reuse a cached layout if this exact graph was drawn before,
+    # otherwise precompute one for large graphs
+    layout_path = _layout_cache_path(nodes, edge_index)
+    cached_layout = _load_layout(layout_path, nodes)
+    node_layout = cached_layout
+    if node_layout is None and _HAS_CUGRAPH and len(nodes) > _GPU_LAYOUT_MIN_NODES:
+        try:
+            node_layout = _gpu_force_atlas2(nodes, edge_index)
+        except Exception as exc:
+            # CUDA errors on import, driver mismatches, GPU out-of-memory and
+            # the like fall back to the CPU layouts below
+            warnings.warn(
+                f"GPU layout failed, falling back to CPU layout: {exc}", stacklevel=2
+            )
+    if node_layout is None:
+        if len(nodes) > _SPARSE_LAYOUT_MIN_NODES:
+            node_layout = _sparse_fruchterman_reingold(nodes, edge_index)
+        else:
+            node_layout = 'spring'
+
     # Step 6: Visualize the graph using NetGraph
     try:
         plot_instance = ngGraph(
-            G,
-            node_layout='spring',             # Layout algorithm
+            # NetGraph can't infer the format of an empty list, but does
+            # take an empty (0, 2) array for a graph of isolated nodes
+            edge_list or np.empty((0, 2)),
+            nodes=nodes,
+            node_layout=node_layout,
             node_size=5,
             node_color='lightblue',
             edge_width=0.4,
             edge_alpha=1,
             edge_color='black',
             node_labels=True,
-            edge_labels=nx.get_edge_attributes(G, 'type'),
             arrows=True,
             ax=ax,
             arrowsize=1,
@@ -107,9 +597,151 @@ def display_graph(uri: str, username: str, password: str):
         plt.close('all')
         return "Nothing to Plot, add memories"
 
+    if cached_layout is None:
+        _save_layout(layout_path, plot_instance.node_positions)
+
     plt.title("Mem0 Graph Memory Visualization", fontsize=20)
 
-    # Step 7: Add mouse scroll zoom functionality
+    # Step 7: Hide artists outside the current view. Matplotlib's redraw cost
+    # scales with the number of visible artists, so panning a zoomed-in view
+    # of a dense graph only pays for what is on screen. Text is among the
+    # slowest artists to render, so node labels are only shown once the view
+    # is zoomed in far enough for them to be legible.
+    node_keys = list(plot_instance.node_artists)
+    node_xy = np.array([plot_instance.node_positions[node] for node in node_keys])
+    node_pad = max(plot_instance.node_size.values())
+    edge_keys = list(plot_instance.edge_artists)
+    # Bounding box of every edge path in one pass over all path points,
+    # rather than two numpy reductions per edge
+    edge_lo = edge_hi = edge_start = edge_end = np.empty((0, 2))
+    if edge_keys:
+        edge_paths = [plot_instance.edge_paths[edge] for edge in edge_keys]
+        path_points = np.concatenate(edge_paths)
+        path_lengths = np.array([len(path) for path in edge_paths])
+        path_starts = np.cumsum(path_lengths) - path_lengths
+        edge_lo = np.minimum.reduceat(path_points, path_starts, axis=0)
+        edge_hi = np.maximum.reduceat(path_points, path_starts, axis=0)
+        edge_start = path_points[path_starts]
+        edge_end = path_points[path_starts + path_lengths - 1]
+
+    node_label_artists = getattr(plot_instance, 'node_label_artists', {})
+    artist_groups = {
+        'nodes': [plot_instance.node_artists[node] for node in node_keys],
+        'node_labels': [node_label_artists.get(node) for node in node_keys],
+        'edges': [plot_instance.edge_artists[edge] for edge in edge_keys],
+    }
+    # Everything starts out visible, as drawn by NetGraph
+    shown = {group: np.ones(len(artists), dtype=bool)
+             for group, artists in artist_groups.items()}
+
+    def set_shown(group, target):
+        """Toggles only those artists in a group whose visibility changes."""
+        artists = artist_groups[group]
+        for i in np.flatnonzero(target != shown[group]):
+            if artists[i] is not None:
+                artists[i].set_visible(target[i])
+        shown[group] = target
+
+    def cull_to_view():
+        """Updates artist visibility for the current view limits."""
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+
+        nodes_visible = (
+            (node_xy[:, 0] >= x0 - node_pad) & (node_xy[:, 0] <= x1 + node_pad)
+            & (node_xy[:, 1] >= y0 - node_pad) & (node_xy[:, 1] <= y1 + node_pad)
+        )
+        # An edge is kept if its bounding box overlaps the view
+        edges_visible = (
+            (edge_hi[:, 0] >= x0) & (edge_lo[:, 0] <= x1)
+            & (edge_hi[:, 1] >= y0) & (edge_lo[:, 1] <= y1)
+        )
+        show_labels = np.count_nonzero(nodes_visible) <= _MAX_LABELLED_NODES
+
+        set_shown('nodes', nodes_visible)
+        set_shown('node_labels', nodes_visible & show_labels)
+        set_shown('edges', edges_visible)
+
+    cull_to_view()
+
+    # Step 8: Show the relationship type of the edge under the cursor. One
+    # text artist is moved around instead of drawing a label for every edge,
+    # and where the backend supports it, it is blitted over a cached copy of
+    # the canvas rather than redrawing the whole graph.
+    edge_types = [edge_labels[edge] for edge in edge_keys]
+    use_blit = fig.canvas.supports_blit
+    hover_label = ax.text(
+        0, 0, '', visible=False, animated=use_blit, zorder=10,
+        ha='center', va='bottom', fontsize=12,
+        bbox={'boxstyle': 'round', 'facecolor': 'white', 'alpha': 0.8},
+    )
+    background = None
+    hovered = None
+    last_hover_t = 0.0
+
+    def on_draw(event):
+        """Caches the freshly drawn canvas as the background for the label."""
+        nonlocal background, hovered
+        background = fig.canvas.copy_from_bbox(fig.bbox) if use_blit else None
+        if use_blit:
+            # Animated artists aren't part of a full draw
+            hovered = None
+            hover_label.set_visible(False)
+
+    def edge_under_cursor(event):
+        """Returns the index of the visible edge nearest the cursor, or None."""
+        candidates = np.flatnonzero(shown['edges'])
+        if not candidates.size:
+            return None
+        start = ax.transData.transform(edge_start[candidates])
+        end = ax.transData.transform(edge_end[candidates])
+        cursor = np.array([event.x, event.y])
+
+        # Distance in pixels from the cursor to each edge's segment
+        segment = end - start
+        length2 = np.einsum('ij,ij->i', segment, segment)
+        length2[length2 == 0] = 1.0
+        t = np.clip(np.einsum('ij,ij->i', cursor - start, segment) / length2, 0, 1)
+        distance = np.hypot(*(start + t[:, None] * segment - cursor).T)
+
+        nearest = np.argmin(distance)
+        if distance[nearest] > _HOVER_TOLERANCE_PX:
+            return None
+        return candidates[nearest]
+
+    def on_hover(event):
+        """
+        Shows the hovered edge's relationship type next to the cursor, hit
+        testing at most once per frame.
+        """
+        nonlocal hovered, last_hover_t
+        if ax._pan_start:
+            return
+        now = time.monotonic()
+        if now - last_hover_t < _FRAME_INTERVAL:
+            return
+        last_hover_t = now
+        edge = edge_under_cursor(event) if event.inaxes == ax else None
+        if edge == hovered:
+            return
+        hovered = edge
+
+        if edge is None:
+            hover_label.set_visible(False)
+        else:
+            hover_label.set_text(edge_types[edge])
+            hover_label.set_position((event.xdata, event.ydata))
+            hover_label.set_visible(True)
+
+        if background is not None:
+            fig.canvas.restore_region(background)
+            if edge is not None:
+                ax.draw_artist(hover_label)
+            fig.canvas.blit(fig.bbox)
+        else:
+            fig.canvas.draw_idle()
+
+    # Step 9: Add mouse scroll zoom functionality
     def zoom_factory(ax, base_scale=2.):
         """
         Adds scroll-to-zoom functionality on the matplotlib axes.
@@ -124,7 +756,7 @@ def display_graph(uri: str, username: str, password: str):
         Returns:
         --------
         function
-            Zoom function bound to scroll events
+            Zoom function to bind to scroll events
         """
         def zoom_fun(event):
             cur_xlim = ax.get_xlim()
@@ -151,52 +783,89 @@ def display_graph(uri: str, username: str, password: str):
                 ydata - new_height * (1 - rely), 
                 ydata + new_height * rely
             ])
-            plt.draw()
+            cull_to_view()
+            fig.canvas.draw_idle()
 
         fig = ax.get_figure()
-        fig.canvas.mpl_connect('scroll_event', zoom_fun)
         return zoom_fun
 
     zoom = zoom_factory(ax)
 
-    # Step 8: Add mouse drag/pan functionality
+    # Step 10: Add mouse drag/pan functionality
+    ax._pan_start = None
+    ax._pan_extent = None
+    ax._last_motion_t = 0.0
+
     def on_press(event):
         """Records the starting position when mouse is pressed."""
         if event.inaxes != ax:
             return
         ax._pan_start = (event.x, event.y)
+        # The axes don't change size mid-drag, so measure them once per drag
+        ax._pan_extent = ax.get_window_extent().frozen()
 
     def on_release(event):
-        """Resets the pan start position when mouse button is released."""
+        """Resets the pan state when mouse button is released."""
         if event.inaxes != ax:
             return
+        if ax._pan_start and (event.x, event.y) != ax._pan_start:
+            # Catch up on any movement dropped by the motion throttle
+            pan_to(event)
         ax._pan_start = None
+        ax._pan_extent = None
 
     def on_motion(event):
-        """Moves the plot when mouse is dragged."""
+        """Moves the plot when mouse is dragged, at most once per frame."""
         if event.inaxes != ax or not ax._pan_start:
             return
+        now = time.monotonic()
+        if now - ax._last_motion_t < _FRAME_INTERVAL:
+            # Skipped movement accumulates, as _pan_start is left untouched
+            return
+        ax._last_motion_t = now
+        pan_to(event)
+
+    def pan_to(event):
+        """Shifts the view by the mouse movement since the last applied pan."""
         dx = event.x - ax._pan_start[0]
         dy = event.y - ax._pan_start[1]
 
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-        scale_x = (xlim[1] - xlim[0]) / ax.get_window_extent().width
-        scale_y = (ylim[1] - ylim[0]) / ax.get_window_extent().height
+        # Plain scalar arithmetic: cheaper per event than broadcasting the
+        # shift over the limit arrays
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        shift_x = dx * (x1 - x0) / ax._pan_extent.width
+        shift_y = dy * (y1 - y0) / ax._pan_extent.height
 
-        ax.set_xlim(xlim - dx * scale_x)
-        ax.set_ylim(ylim + dy * scale_y)
+        ax.set_xlim(x0 - shift_x, x1 - shift_x)
+        ax.set_ylim(y0 + shift_y, y1 + shift_y)
 
         ax._pan_start = (event.x, event.y)
-        plt.draw()
+        cull_to_view()
+        # Coalesce redraws: events arriving before the canvas gets round to
+        # drawing share a single render instead of queueing one each
+        fig.canvas.draw_idle()
+
+    # Bind zoom, pan and hover events to the figure
+    cids = [
+        fig.canvas.mpl_connect('scroll_event', zoom),
+        fig.canvas.mpl_connect('button_press_event', on_press),
+        fig.canvas.mpl_connect('button_release_event', on_release),
+        fig.canvas.mpl_connect('motion_notify_event', on_motion),
+        fig.canvas.mpl_connect('motion_notify_event', on_hover),
+        fig.canvas.mpl_connect('draw_event', on_draw),
+    ]
+
+    def on_close(event):
+        """
+        Disconnects all handlers when the figure is closed. Their closures
+        hold the plotted graph data, which would otherwise stay alive for as
+        long as the canvas does.
+        """
+        for cid in cids:
+            fig.canvas.mpl_disconnect(cid)
 
-    # Bind pan events to the figure
-    fig.canvas.mpl_connect('button_press_event', on_press)
-    fig.canvas.mpl_connect('button_release_event', on_release)
-    fig.canvas.mpl_connect('motion_notify_event', on_motion)
+    cids.append(fig.canvas.mpl_connect('close_event', on_close))
 
-    # Step 9: Show the final interactive graph
+    # Step 11: Show the final interactive graph
     plt.show()
-
-    # Step 10: Close the Neo4j connection
-    driver.close()
\ No newline at end of file